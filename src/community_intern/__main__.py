@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 import asyncio
 import logging
+from typing import Callable
 
 from community_intern.adapters.discord import DiscordBotAdapter
 from community_intern.ai_response import AIResponseService
@@ -22,6 +23,11 @@ def _build_parser() -> argparse.ArgumentParser:
         default="data/config/config.yaml",
         help="Path to config.yaml (default: data/config/config.yaml)",
     )
+    parser.add_argument(
+        "--no-uvloop",
+        action="store_true",
+        help="Use the default asyncio event loop even when uvloop is installed.",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True, help="Command to run")
 
     # Command: run
@@ -44,8 +50,9 @@ def _build_parser() -> argparse.ArgumentParser:
 
 async def _stop_adapter_gracefully(adapter: DiscordBotAdapter, *, timeout_seconds: float = 15.0) -> None:
     try:
-        await asyncio.wait_for(asyncio.shield(adapter.stop()), timeout=timeout_seconds)
-    except asyncio.TimeoutError:
+        async with asyncio.timeout(timeout_seconds):
+            await asyncio.shield(adapter.stop())
+    except TimeoutError:
         logger.warning("Shutdown timed out while stopping the Discord adapter. timeout_seconds=%s", timeout_seconds)
     except Exception:
         logger.exception("Unexpected error during shutdown.")
@@ -153,10 +160,7 @@ async def _init_team_kb(args: argparse.Namespace) -> None:
     logger.info("Team knowledge base initialization completed.")
 
 
-async def _main_async() -> None:
-    parser = _build_parser()
-    args = parser.parse_args()
-
+async def _main_async(args: argparse.Namespace) -> None:
     if args.command == "run":
         await _run_bot(args)
     elif args.command == "init_kb":
@@ -165,9 +169,20 @@ async def _main_async() -> None:
         await _init_team_kb(args)
 
 
+def _event_loop_factory(args: argparse.Namespace) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    if args.no_uvloop:
+        return None
+    try:
+        import uvloop
+    except ModuleNotFoundError:
+        return None
+    return uvloop.new_event_loop
+
+
 def main() -> None:
+    args = _build_parser().parse_args()
     try:
-        asyncio.run(_main_async())
+        asyncio.run(_main_async(args), loop_factory=_event_loop_factory(args))
     except KeyboardInterrupt:
         logger.info("Interrupted by user.")
 
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from community_intern.core.formatters import format_conversation_as_text
+from community_intern.core.models import AIResult, Conversation, RequestContext
+
+
+def build_response_cache_key(
+    conversation: Conversation,
+    context: RequestContext,
+    *,
+    index_text: str,
+) -> Optional[str]:
+    """
+    Builds the response cache key for a conversation.
+
+    The key is namespaced by platform, guild, and channel so replies never cross tenants.
+    The knowledge base index text is part of the digest, so any change to the index invalidates earlier replies.
+    Conversations that carry images return None because their content cannot be compared as text.
+    """
+    if not conversation.messages:
+        return None
+    if any(msg.images for msg in conversation.messages):
+        return None
+    text = " ".join(format_conversation_as_text(conversation).lower().split())
+    if not text:
+        return None
+    digest = hashlib.sha256()
+    digest.update(hashlib.sha256(index_text.encode("utf-8")).digest())
+    digest.update(text.encode("utf-8"))
+    return f"{context.platform}:{context.guild_id or ''}:{context.channel_id}:{digest.hexdigest()}"
+
+
+class ResponseCache:
+    """In-memory LRU cache of generated replies with a fixed time-to-live."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, AIResult]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0 and self._max_entries > 0
+
+    def get(self, key: str) -> Optional[AIResult]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def set(self, key: str, result: AIResult) -> None:
+        if not self.enabled:
+            return
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -30,6 +30,10 @@ class AIConfig(BaseModel):
     # Output policy
     max_answer_chars: int
 
+    # Response cache
+    response_cache_ttl_seconds: float = 600
+    response_cache_max_entries: int = 256
+
     # Image support
     llm_enable_image: bool = False
     llm_image_adapter: str = "OpenAIImageAdapter"
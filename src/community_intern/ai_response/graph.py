@@ -1,20 +1,23 @@
 import logging
 import time
-from functools import partial
-from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING, TypedDict
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Any, Dict, List, Optional, Sequence, TypedDict
 
 from langchain_core.messages import SystemMessage, HumanMessage
 from langchain_core.runnables import Runnable
 from langchain_crynux import ChatCrynux
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph, END, START
+from langgraph.runtime import Runtime
 from pydantic import BaseModel, Field
 
 from community_intern.ai_response.config import AIConfig
 from community_intern.llm.image_adapters import ContentPart, ImagePart, LLMImageAdapter, TextPart
+from community_intern.llm.settings import LLMSettings
 from community_intern.core.models import AttachmentInput, Conversation, ImageInput, Message, RequestContext, AIResult
 from community_intern.kb.interfaces import KnowledgeBase, SourceContent
 from community_intern.llm.prompts import compose_system_prompt
-from community_intern.llm.structured_output import parse_structured_llm_result
+from community_intern.llm.structured_output import extract_cached_input_tokens, parse_structured_llm_result
 from community_intern.core.formatters import format_message_as_text, format_conversation_as_text
 from community_intern.logging.flow import (
     format_conversation_messages,
@@ -26,21 +29,24 @@ from community_intern.logging.flow import (
 
 logger = logging.getLogger(__name__)
 
-if TYPE_CHECKING:
-    from langchain_openai import ChatOpenAI
-
 # --- Graph State ---
 
-class GraphState(TypedDict):
+@dataclass(frozen=True, slots=True)
+class GraphContext:
+    """Immutable per-request inputs, passed as the LangGraph runtime context instead of graph state."""
+
     conversation: Conversation
     context: RequestContext
     config: AIConfig
     kb: KnowledgeBase
+    user_parts: Sequence[ContentPart]
 
+
+class GraphState(TypedDict):
     user_question: str
-    user_parts: List[ContentPart]
 
     kb_index_text: str
+    kb_index_loaded: bool
     selected_source_ids: List[str]
     loaded_sources: List[SourceContent]
 
@@ -101,11 +107,15 @@ def _log_llm_flow(fields: Sequence[tuple[str, object]]) -> None:
 
 
 async def node_gating(
-    state: GraphState, *, llm: "ChatOpenAI", image_adapter: LLMImageAdapter
+    state: GraphState,
+    runtime: Runtime[GraphContext],
+    *,
+    structured_llm: Runnable,
+    image_adapter: LLMImageAdapter,
 ) -> Dict[str, Any]:
-    config = state["config"]
-    conversation = state["conversation"]
-    parts = state.get("user_parts", [])
+    config = runtime.context.config
+    conversation = runtime.context.conversation
+    parts = runtime.context.user_parts
 
     last_msg = format_message_as_text(conversation.messages[-1]) if conversation.messages else ""
     if last_msg:
@@ -115,12 +125,6 @@ async def node_gating(
     if not last_msg and parts:
         last_msg = "User provided images without additional text."
 
-    structured_llm = llm.with_structured_output(
-        LLMGateDecision,
-        method=config.llm.structured_output_method,
-        include_raw=True,
-    )
-
     history_text = _format_prior_conversation_as_text(conversation)
     history_block = f"Conversation history:\n{history_text}\n\n" if history_text else ""
     messages = [
@@ -150,9 +154,9 @@ async def node_gating(
                 ("Message", format_conversation_messages(conversation)),
             ]
         )
-        result = await structured_llm.ainvoke(messages)
+        raw_result = await structured_llm.ainvoke(messages)
         decision, response_id = parse_structured_llm_result(
-            result,
+            raw_result,
             LLMGateDecision,
         )
         next_step = "selection" if decision.should_reply else "end"
@@ -161,6 +165,7 @@ async def node_gating(
                 ("Event", "LLM gating result has been received"),
                 ("Step", "gating"),
                 ("ID", response_id),
+                ("Cached input tokens", extract_cached_input_tokens(raw_result)),
                 ("Should reply", decision.should_reply),
                 ("Next step", next_step),
                 ("Elapsed milliseconds", int((time.perf_counter() - started) * 1000)),
@@ -179,28 +184,36 @@ async def node_gating(
         }
 
 
-async def node_selection(
-    state: GraphState, *, llm: "ChatOpenAI", image_adapter: LLMImageAdapter
-) -> Dict[str, Any]:
-    config = state["config"]
-    kb = state["kb"]
-    query = state["user_question"]
-    conversation = state["conversation"]
-    parts = state.get("user_parts", [])
-    if not query and parts:
-        query = "User provided images without additional text."
-
+async def node_load_index(state: GraphState, runtime: Runtime[GraphContext]) -> Dict[str, Any]:
+    if state.get("kb_index_loaded", False):
+        return {}
     try:
-        kb_index_text = await kb.load_index_text()
+        kb_index_text = await runtime.context.kb.load_index_text()
     except Exception:
         logger.exception("Failed to load knowledge base index.")
+        return {"kb_index_loaded": False}
+    return {"kb_index_text": kb_index_text, "kb_index_loaded": True}
+
+
+async def node_selection(
+    state: GraphState,
+    runtime: Runtime[GraphContext],
+    *,
+    structured_llm: Runnable,
+    image_adapter: LLMImageAdapter,
+) -> Dict[str, Any]:
+    if not state.get("should_reply", False):
+        return {}
+    if not state.get("kb_index_loaded", False):
         return {"selected_source_ids": [], "should_reply": False}
 
-    structured_llm = llm.with_structured_output(
-        LLMSelectionResult,
-        method=config.llm.structured_output_method,
-        include_raw=True,
-    )
+    config = runtime.context.config
+    kb_index_text = state["kb_index_text"]
+    query = state["user_question"]
+    conversation = runtime.context.conversation
+    parts = runtime.context.user_parts
+    if not query and parts:
+        query = "User provided images without additional text."
 
     history_text = _format_prior_conversation_as_text(conversation)
     history_block = f"Conversation history:\n{history_text}\n\n" if history_text else ""
@@ -217,7 +230,7 @@ async def node_selection(
             )
         ),
         _build_user_message(
-            text=f"{history_block}Index:\n{kb_index_text}\n\nQuery: {query}",
+            text=f"Index:\n{kb_index_text}\n\n{history_block}Query: {query}",
             parts=parts,
             adapter=image_adapter,
             enable_images=config.llm_enable_image,
@@ -251,6 +264,7 @@ async def node_selection(
                 ("Event", "LLM source selection result has been received"),
                 ("Step", "selection"),
                 ("ID", response_id),
+                ("Cached input tokens", extract_cached_input_tokens(raw_result)),
                 ("Selected source count", len(selected_ids)),
                 ("Selected source IDs", format_source_ids(selected_ids)),
                 ("Next step", next_step),
@@ -262,14 +276,14 @@ async def node_selection(
         if not selected_ids:
             return {"selected_source_ids": [], "should_reply": False}
 
-        return {"selected_source_ids": selected_ids, "kb_index_text": kb_index_text}
+        return {"selected_source_ids": selected_ids}
     except Exception:
         logger.exception("AI knowledge base source selection failed.")
         return {"selected_source_ids": [], "should_reply": False}
 
 
-async def node_loading(state: GraphState) -> Dict[str, Any]:
-    kb = state["kb"]
+async def node_loading(state: GraphState, runtime: Runtime[GraphContext]) -> Dict[str, Any]:
+    kb = runtime.context.kb
     selected_ids = state["selected_source_ids"]
 
     loaded = []
@@ -288,7 +302,7 @@ async def node_loading(state: GraphState) -> Dict[str, Any]:
                 ("Loaded source count", 0),
                 ("Loaded source IDs", "None"),
                 ("Next step", "end"),
-                ("Message", format_conversation_messages(state["conversation"])),
+                ("Message", format_conversation_messages(runtime.context.conversation)),
             ]
         )
         return {"loaded_sources": [], "should_reply": False}
@@ -301,31 +315,29 @@ async def node_loading(state: GraphState) -> Dict[str, Any]:
             ("Loaded source count", len(loaded)),
             ("Loaded source IDs", format_source_ids(source.source_id for source in loaded)),
             ("Next step", "generation"),
-            ("Message", format_conversation_messages(state["conversation"])),
+            ("Message", format_conversation_messages(runtime.context.conversation)),
         ]
     )
     return {"loaded_sources": loaded}
 
 
 async def node_generation(
-    state: GraphState, *, llm: "ChatOpenAI", image_adapter: LLMImageAdapter
+    state: GraphState,
+    runtime: Runtime[GraphContext],
+    *,
+    structured_llm: Runnable,
+    image_adapter: LLMImageAdapter,
 ) -> Dict[str, Any]:
-    config = state["config"]
+    config = runtime.context.config
     loaded = state["loaded_sources"]
     query = state["user_question"]
-    conversation = state["conversation"]
-    parts = state.get("user_parts", [])
+    conversation = runtime.context.conversation
+    parts = runtime.context.user_parts
     if not query and parts:
         query = "User provided images without additional text."
 
     sources_text = "\n\n".join([f"Source: {s.source_id}\nContent:\n{s.text}" for s in loaded])
 
-    structured_llm = llm.with_structured_output(
-        LLMGenerationResult,
-        method=config.llm.structured_output_method,
-        include_raw=True,
-    )
-
     history_text = _format_prior_conversation_as_text(conversation)
     history_block = f"Conversation history:\n{history_text}\n\n" if history_text else ""
     messages = [
@@ -336,7 +348,7 @@ async def node_generation(
             )
         ),
         _build_user_message(
-            text=f"{history_block}Context:\n{sources_text}\n\nQuestion: {query}",
+            text=f"Context:\n{sources_text}\n\n{history_block}Question: {query}",
             parts=parts,
             adapter=image_adapter,
             enable_images=config.llm_enable_image,
@@ -375,6 +387,7 @@ async def node_generation(
                 ("Event", "LLM answer generation result has been received"),
                 ("Step", "generation"),
                 ("ID", response_id),
+                ("Cached input tokens", extract_cached_input_tokens(raw_result)),
                 ("Has answer", has_answer),
                 ("Answer characters", text_chars(answer)),
                 ("Answer", format_text_preview(answer)),
@@ -400,22 +413,20 @@ async def node_generation(
 
 
 async def node_verification(
-    state: GraphState, *, llm: "ChatOpenAI", image_adapter: LLMImageAdapter
+    state: GraphState,
+    runtime: Runtime[GraphContext],
+    *,
+    structured_llm: Runnable,
+    image_adapter: LLMImageAdapter,
 ) -> Dict[str, Any]:
-    config = state["config"]
+    config = runtime.context.config
     draft = state["draft_answer"]
     loaded = state["loaded_sources"]
-    conversation = state["conversation"]
-    parts = state.get("user_parts", [])
+    conversation = runtime.context.conversation
+    parts = runtime.context.user_parts
 
     sources_text = "\n\n".join([f"Source: {s.source_id}\nContent:\n{s.text}" for s in loaded])
 
-    structured_llm = llm.with_structured_output(
-        LLMVerificationResult,
-        method=config.llm.structured_output_method,
-        include_raw=True,
-    )
-
     history_text = format_conversation_as_text(conversation)
     history_block = f"Conversation history:\n{history_text}\n\n" if history_text else ""
     messages = [
@@ -426,7 +437,7 @@ async def node_verification(
             )
         ),
         _build_user_message(
-            text=f"{history_block}Context:\n{sources_text}\n\nDraft Answer: {draft}",
+            text=f"Context:\n{sources_text}\n\n{history_block}Draft Answer: {draft}",
             parts=parts,
             adapter=image_adapter,
             enable_images=config.llm_enable_image,
@@ -461,6 +472,7 @@ async def node_verification(
                 ("Event", "LLM answer verification result has been received"),
                 ("Step", "verification"),
                 ("ID", response_id),
+                ("Cached input tokens", extract_cached_input_tokens(raw_result)),
                 ("Is good enough", is_good_enough),
                 ("Next step", "end"),
                 ("Elapsed milliseconds", int((time.perf_counter() - started) * 1000)),
@@ -486,11 +498,19 @@ async def node_verification(
 def build_ai_graph(config: AIConfig, *, image_adapter: LLMImageAdapter) -> Runnable:
     """
     Builds and compiles the AI LangGraph application.
-    This should be called once at startup.
+
+    Compiled graphs are shared between callers whose LLM settings, verification flag, and image adapter match.
     """
+    return _compile_ai_graph(config.llm, config.enable_verification, image_adapter)
 
+
+@lru_cache(maxsize=8)
+def _compile_ai_graph(
+    llm_config: LLMSettings,
+    enable_verification: bool,
+    image_adapter: LLMImageAdapter,
+) -> Runnable:
     # Initialize LLM once
-    llm_config = config.llm
     llm = ChatCrynux(
         base_url=llm_config.base_url,
         api_key=llm_config.api_key,
@@ -501,28 +521,46 @@ def build_ai_graph(config: AIConfig, *, image_adapter: LLMImageAdapter) -> Runna
         max_retries=llm_config.max_retries,
     )
 
-    workflow = StateGraph(GraphState)
+    def structured(response_model: type[BaseModel]) -> Runnable:
+        return llm.with_structured_output(
+            response_model,
+            method=llm_config.structured_output_method,
+            include_raw=True,
+        )
 
-    # Inject LLM into nodes using partial application
-    workflow.add_node("gating", partial(node_gating, llm=llm, image_adapter=image_adapter))
-    workflow.add_node("selection", partial(node_selection, llm=llm, image_adapter=image_adapter))
-    workflow.add_node("loading", node_loading)
-    workflow.add_node("generation", partial(node_generation, llm=llm, image_adapter=image_adapter))
-    workflow.add_node("verification", partial(node_verification, llm=llm, image_adapter=image_adapter))
+    workflow = StateGraph(GraphState, context_schema=GraphContext)
 
-    workflow.set_entry_point("gating")
+    # Inject structured LLM runnables into nodes using partial application
+    workflow.add_node(
+        "gating",
+        partial(node_gating, structured_llm=structured(LLMGateDecision), image_adapter=image_adapter),
+    )
+    workflow.add_node("load_index", node_load_index)
+    workflow.add_node(
+        "selection",
+        partial(node_selection, structured_llm=structured(LLMSelectionResult), image_adapter=image_adapter),
+    )
+    workflow.add_node("loading", node_loading)
+    workflow.add_node(
+        "generation",
+        partial(node_generation, structured_llm=structured(LLMGenerationResult), image_adapter=image_adapter),
+    )
+    workflow.add_node(
+        "verification",
+        partial(node_verification, structured_llm=structured(LLMVerificationResult), image_adapter=image_adapter),
+    )
 
-    def check_gating(state: GraphState) -> str:
-        if state.get("should_reply", False):
-            return "selection"
-        return END
+    # Gating and index loading are independent, so they run in parallel and join at selection.
+    workflow.add_edge(START, "gating")
+    workflow.add_edge(START, "load_index")
+    workflow.add_edge(["gating", "load_index"], "selection")
 
-    def check_selection(state: GraphState) -> str:
+    def check_selection(state: GraphState, runtime: Runtime[GraphContext]) -> str:
         if not state.get("should_reply", False):
             return END
         if state.get("selected_source_ids"):
             return "loading"
-        if state.get("user_parts"):
+        if runtime.context.user_parts:
             return "generation"
         return END
 
@@ -533,7 +571,7 @@ def build_ai_graph(config: AIConfig, *, image_adapter: LLMImageAdapter) -> Runna
 
     def check_generation(state: GraphState) -> str:
         if state.get("should_reply", False) and state.get("draft_answer"):
-            if state["config"].enable_verification:
+            if enable_verification:
                 return "verification"
             return END
         return END
@@ -543,7 +581,6 @@ def build_ai_graph(config: AIConfig, *, image_adapter: LLMImageAdapter) -> Runna
             return END
         return END
 
-    workflow.add_conditional_edges("gating", check_gating)
     workflow.add_conditional_edges("selection", check_selection)
     workflow.add_conditional_edges("loading", check_loading)
     workflow.add_conditional_edges("generation", check_generation)
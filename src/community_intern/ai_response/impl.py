@@ -2,34 +2,36 @@ import logging
 import asyncio
 from typing import Optional
 from langchain_core.runnables import Runnable
+from community_intern.ai_response.cache import ResponseCache, build_response_cache_key
 from community_intern.ai_response.config import AIConfig
 from community_intern.llm.image_adapters import ContentPart, ImagePart, get_image_adapter
 from community_intern.core.models import AIResult, Conversation, RequestContext
 from community_intern.llm.image_utils import build_base64_images
 from community_intern.kb.interfaces import KnowledgeBase
-from community_intern.ai_response.graph import build_ai_graph, GraphState
+from community_intern.ai_response.graph import build_ai_graph, GraphContext, GraphState
 
 logger = logging.getLogger(__name__)
 
+_URL_PREFIXES = ("http://", "https://")
+_KB_PREFIX = "kb:"
+
 def _append_selected_links(reply_text: str, *, selected_source_ids: list[str]) -> str:
-    links = []
+    if not selected_source_ids:
+        return reply_text
+
+    links: list[str] = []
     for source_id in selected_source_ids:
         raw = source_id.strip()
-        if raw.startswith(("http://", "https://")):
+        if raw.startswith(_URL_PREFIXES):
             links.append(raw)
-            continue
-        if raw.startswith("kb:"):
-            inner = raw[len("kb:") :].strip()
-            if inner.startswith(("http://", "https://")):
+        elif raw.startswith(_KB_PREFIX):
+            inner = raw[len(_KB_PREFIX) :].strip()
+            if inner.startswith(_URL_PREFIXES):
                 links.append(inner)
 
     if not links:
         return reply_text
-
-    lines = [reply_text.rstrip(), "", "Links:"]
-    for link in links:
-        lines.append(f"- {link}")
-    return "\n".join(lines).strip()
+    return "\n".join([reply_text.rstrip(), "", "Links:", *[f"- {link}" for link in links]]).strip()
 
 
 class AIResponseService:
@@ -40,6 +42,10 @@ class AIResponseService:
         # Build and compile the graph for generate_reply
         self._image_adapter = get_image_adapter(config.llm_image_adapter)
         self._app: Runnable = build_ai_graph(config, image_adapter=self._image_adapter)
+        self._response_cache = ResponseCache(
+            ttl_seconds=config.response_cache_ttl_seconds,
+            max_entries=config.response_cache_max_entries,
+        )
 
     def set_kb(self, kb: KnowledgeBase) -> None:
         """
@@ -47,11 +53,36 @@ class AIResponseService:
         """
         self._kb = kb
 
+    async def _load_index_for_cache(self) -> Optional[str]:
+        try:
+            return await self._kb.load_index_text()
+        except Exception:
+            logger.exception("Failed to load knowledge base index for the response cache key. Bypassing cache.")
+            return None
+
     async def generate_reply(self, conversation: Conversation, context: RequestContext) -> AIResult:
         if not self._kb:
             logger.warning("Knowledge base is not configured, skipping AI reply generation.")
             return AIResult(should_reply=False, reply_text=None)
 
+        # The index text loaded for the cache key is handed to the graph so it is read once per request.
+        index_text: Optional[str] = None
+        cache_key: Optional[str] = None
+        if self._response_cache.enabled:
+            index_text = await self._load_index_for_cache()
+            if index_text is not None:
+                cache_key = build_response_cache_key(conversation, context, index_text=index_text)
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.info(
+                    "AI reply served from response cache. platform=%s channel_id=%s message_id=%s",
+                    context.platform,
+                    context.channel_id,
+                    context.message_id,
+                )
+                return cached
+
         user_parts: list[ContentPart] = []
         if self._config.llm_enable_image:
             try:
@@ -68,14 +99,17 @@ class AIResponseService:
                     debug={"error": "image_base64_missing"},
                 )
 
+        graph_context = GraphContext(
+            conversation=conversation,
+            context=context,
+            config=self._config,
+            kb=self._kb,
+            user_parts=user_parts,
+        )
         initial_state: GraphState = {
-            "conversation": conversation,
-            "context": context,
-            "config": self._config,
-            "kb": self._kb,
             "user_question": "",
-            "user_parts": user_parts,
-            "kb_index_text": "",
+            "kb_index_text": index_text or "",
+            "kb_index_loaded": index_text is not None,
             "selected_source_ids": [],
             "loaded_sources": [],
             "draft_answer": "",
@@ -85,10 +119,8 @@ class AIResponseService:
         }
 
         try:
-            final_state = await asyncio.wait_for(
-                self._app.ainvoke(initial_state),
-                timeout=self._config.graph_timeout_seconds
-            )
+            async with asyncio.timeout(self._config.graph_timeout_seconds):
+                final_state = await self._app.ainvoke(initial_state, context=graph_context)
 
             reply_text = final_state.get("final_reply_text")
             selected_source_ids = list(final_state.get("selected_source_ids", []))
@@ -98,14 +130,17 @@ class AIResponseService:
                     selected_source_ids=selected_source_ids,
                 )
 
-            return AIResult(
+            result = AIResult(
                 should_reply=final_state.get("should_reply", False),
                 reply_text=reply_text,
                 debug={
                     "verification": final_state.get("verification")
                 }
             )
-        except asyncio.TimeoutError:
+            if cache_key is not None and result.should_reply and reply_text:
+                self._response_cache.set(cache_key, result)
+            return result
+        except TimeoutError:
             logger.warning("AI graph timed out while generating a reply.")
             return AIResult(should_reply=False, reply_text=None)
         except Exception:
@@ -113,11 +148,5 @@ class AIResponseService:
             return AIResult(should_reply=False, reply_text=None)
 
 def _build_user_parts(conversation: Conversation) -> list[ContentPart]:
-    parts: list[ContentPart] = []
-    for msg in conversation.messages:
-        if msg.role != "user":
-            continue
-        if msg.images:
-            base64_images = build_base64_images(msg.images)
-            parts.extend([ImagePart(type="image", image=img) for img in base64_images])
-    return parts
+    user_images = [msg.images for msg in conversation.messages if msg.role == "user" and msg.images]
+    return [ImagePart(type="image", image=img) for images in user_images for img in build_base64_images(images)]
@@ -8,13 +8,10 @@ class GraphState(TypedDict):
     Conceptual LangGraph state shape.
 
     This is a contract for orchestration state, not an implementation.
+    Request inputs (conversation, request context, config, knowledge base) are carried
+    in the graph runtime context rather than in state.
     """
 
-    # Inputs (types live in community_intern.core.models and community_intern.ai_response.config)
-    conversation: object
-    context: object
-    config: object
-
     # Derived
     user_question: str
     selected_source_ids: Sequence[str]
@@ -58,6 +58,7 @@ class KnowledgeBaseSettings(BaseModel):
     index_path: str
     index_cache_path: str
     links_file_path: str
+    sources_manifest_path: str = "data/knowledge-base/sources-manifest.json"
 
     llm: Optional[LLMSettings] = None
 
@@ -81,6 +82,7 @@ class KnowledgeBaseSettings(BaseModel):
     team_topics_dir: str = "data/team-knowledge/topics"
     team_index_path: str = "data/team-knowledge/index-team.txt"
     team_index_cache_path: str = "data/team-knowledge/index-team-cache.json"
+    team_topics_manifest_path: str = "data/team-knowledge/topics-manifest.json"
 
     # Team knowledge prompts
     team_classification_prompt: str
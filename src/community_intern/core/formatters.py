@@ -4,6 +4,8 @@ from typing import Optional, Dict
 
 from community_intern.core.models import Message, Conversation
 
+_ATTACHMENT_LABELS = ("Attachment", "Image")
+
 
 def format_attachment_placeholder(filename: Optional[str], is_image: bool = False) -> str:
     """
@@ -17,7 +19,7 @@ def format_attachment_placeholder(filename: Optional[str], is_image: bool = Fals
         A string like "Attachment: file.txt" or "Image: photo.png".
     """
     name = (filename or "").strip()
-    label = "Image" if is_image else "Attachment"
+    label = _ATTACHMENT_LABELS[is_image]
     if name:
         return f"{label}: {name}"
     return f"{label}: file uploaded"
@@ -33,21 +35,16 @@ def format_message_as_text(msg: Message) -> list[str]:
         text_lines.append(raw_text)
     
     if msg.attachments:
-        for attachment in msg.attachments:
-            text_lines.append(
-                format_attachment_placeholder(
-                    attachment.filename, is_image=attachment.is_image
-                )
-            )
-            
+        text_lines.extend(
+            format_attachment_placeholder(attachment.filename, is_image=attachment.is_image)
+            for attachment in msg.attachments
+        )
+
     # If the message has no text and no file attachments, but has images,
     # we add placeholders for the images so they are represented in text.
     if not text_lines and msg.images:
-        for image in msg.images:
-            text_lines.append(
-                format_attachment_placeholder(image.filename, is_image=True)
-            )
-            
+        text_lines.extend(format_attachment_placeholder(image.filename, is_image=True) for image in msg.images)
+
     return text_lines
 
 
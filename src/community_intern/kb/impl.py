@@ -36,7 +36,10 @@ class FileSystemKnowledgeBase:
             summarization_concurrency=config.summarization_concurrency,
             llm_invoker=llm_invoker,
             providers=[
-                FileFolderProvider(sources_dir=config.sources_dir),
+                FileFolderProvider(
+                    sources_dir=config.sources_dir,
+                    manifest_path=config.sources_manifest_path,
+                ),
                 UrlLinksProvider(config=config),
             ],
             source_type_order=["file", "url"],
@@ -76,6 +79,9 @@ class FileSystemKnowledgeBase:
 
         Combines main index and team index if both exist.
         """
+        return await asyncio.to_thread(self._read_index_text)
+
+    def _read_index_text(self) -> str:
         index_path = Path(self.config.index_path)
         team_index_path = Path(self.config.team_index_path)
 
@@ -8,8 +8,11 @@ from typing import Dict, Iterable, Sequence
 from community_intern.knowledge_cache.models import (
     CacheRecord,
     CacheState,
+    DirListing,
     FileMetadata,
+    ManifestSchemaVersion,
     SchemaVersion,
+    SourcesManifest,
     SourceType,
     UrlMetadata,
 )
@@ -129,6 +132,53 @@ def read_cache_file(path: Path) -> CacheState:
         return CacheState(schema_version=SchemaVersion, generated_at=format_rfc3339(utc_now()), sources={})
 
 
+def encode_manifest(manifest: SourcesManifest) -> dict:
+    return {
+        "schema_version": manifest.schema_version,
+        "sources_dir": manifest.sources_dir,
+        "scanned_at_ns": manifest.scanned_at_ns,
+        "dirs": {
+            rel_prefix: {"mtime_ns": listing.mtime_ns, "files": listing.files, "dirs": listing.dirs}
+            for rel_prefix, listing in manifest.dirs.items()
+        },
+    }
+
+
+def decode_manifest(payload: dict) -> SourcesManifest:
+    return SourcesManifest(
+        schema_version=int(payload.get("schema_version", ManifestSchemaVersion)),
+        sources_dir=payload.get("sources_dir", ""),
+        scanned_at_ns=int(payload.get("scanned_at_ns", 0)),
+        dirs={
+            rel_prefix: DirListing(
+                mtime_ns=int(listing["mtime_ns"]),
+                files=list(listing.get("files", [])),
+                dirs=list(listing.get("dirs", [])),
+            )
+            for rel_prefix, listing in payload.get("dirs", {}).items()
+        },
+    )
+
+
+def read_manifest_file(path: Path) -> SourcesManifest | None:
+    if not path.exists():
+        return None
+    try:
+        manifest = decode_manifest(json.loads(path.read_text(encoding="utf-8")))
+    except Exception:
+        logger.exception("Failed to read sources manifest, rescanning sources. path=%s", path)
+        return None
+    if manifest.schema_version != ManifestSchemaVersion:
+        logger.warning(
+            "Sources manifest schema version mismatch, rescanning sources. path=%s expected=%s actual=%s",
+            path,
+            ManifestSchemaVersion,
+            manifest.schema_version,
+        )
+        return None
+    return manifest
+
+
 def build_index_entries(cache: CacheState, *, source_types: Sequence[SourceType], prefix: str) -> list[str]:
     entries: list[str] = []
     for source_type in source_types:
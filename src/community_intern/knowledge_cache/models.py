@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Dict, Literal, Optional
 
 SchemaVersion = 1
+ManifestSchemaVersion = 1
 FetchStatus = Literal["success", "not_modified", "timeout", "error"]
 
 
@@ -44,3 +45,19 @@ class CacheState:
     generated_at: str
     sources: Dict[str, CacheRecord]
 
+
+@dataclass(slots=True)
+class DirListing:
+    mtime_ns: int
+    files: list[str]
+    dirs: list[str]
+
+
+@dataclass(slots=True)
+class SourcesManifest:
+    """Directory listings from the last file discovery, keyed by relative posix prefix."""
+
+    schema_version: int
+    sources_dir: str
+    scanned_at_ns: int
+    dirs: Dict[str, DirListing]
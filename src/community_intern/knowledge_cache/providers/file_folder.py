@@ -1,20 +1,40 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict
 
-from community_intern.knowledge_cache.models import CacheRecord, CacheState, FileMetadata, SourceType
-from community_intern.knowledge_cache.utils import format_rfc3339, hash_text
+from community_intern.knowledge_cache.io import atomic_write_json, encode_manifest, read_manifest_file
+from community_intern.knowledge_cache.models import (
+    CacheRecord,
+    CacheState,
+    DirListing,
+    FileMetadata,
+    ManifestSchemaVersion,
+    SourcesManifest,
+    SourceType,
+)
+from community_intern.knowledge_cache.utils import format_rfc3339, hash_file
 
 logger = logging.getLogger(__name__)
 
+_REFRESH_CONCURRENCY = 32
+
+# Directory mtimes this close to the previous scan may hide later changes on filesystems
+# with coarse timestamps, so such directories are always rescanned.
+_MANIFEST_MTIME_SAFETY_NS = 2_000_000_000
+
 
 class FileFolderProvider:
-    def __init__(self, *, sources_dir: str) -> None:
+    def __init__(self, *, sources_dir: str, manifest_path: str | None = None) -> None:
         self._sources_dir = Path(sources_dir)
-        self._file_sources: Dict[str, Path] = {}
+        self._manifest_path = Path(manifest_path) if manifest_path else None
+        self._manifest: SourcesManifest | None = None
+        self._file_sources: Dict[str, str] = {}
 
     async def discover(self, *, now: datetime) -> Dict[str, SourceType]:
         _ = now
@@ -26,30 +46,88 @@ class FileFolderProvider:
             return sources
 
         logger.debug("FileFolderProvider discover: start. sources_dir=%s", self._sources_dir)
+        previous = self._load_manifest()
+        scanned_at_ns = time.time_ns()
+        listings: Dict[str, DirListing] = {}
         scanned = 0
-        for file_path in self._sources_dir.rglob("*"):
-            scanned += 1
-            if scanned % 2000 == 0:
-                logger.debug("FileFolderProvider discover: scanning. scanned=%s discovered=%s", scanned, len(sources))
-            if not file_path.is_file():
-                continue
-            if file_path.name.startswith("."):
-                continue
+        reused_dirs = 0
+        # Iterative walk over (directory path, relative posix prefix) pairs. Symlinked directories are not followed.
+        pending_dirs: list[tuple[str, str]] = [(str(self._sources_dir), "")]
+        while pending_dirs:
+            dir_path, rel_prefix = pending_dirs.pop()
             try:
-                rel_path = file_path.relative_to(self._sources_dir).as_posix()
-            except ValueError:
+                mtime_ns = os.stat(dir_path).st_mtime_ns
+                listing = _reusable_listing(previous, rel_prefix, mtime_ns)
+                if listing is not None:
+                    reused_dirs += 1
+                else:
+                    listing = DirListing(mtime_ns=mtime_ns, files=[], dirs=[])
+                    with os.scandir(dir_path) as entries:
+                        for entry in entries:
+                            scanned += 1
+                            if scanned % 2000 == 0:
+                                logger.debug(
+                                    "FileFolderProvider discover: scanning. scanned=%s discovered=%s",
+                                    scanned,
+                                    len(sources),
+                                )
+                            if entry.is_dir(follow_symlinks=False):
+                                listing.dirs.append(entry.name)
+                                continue
+                            if entry.name.startswith(".") or not entry.is_file():
+                                continue
+                            listing.files.append(entry.name)
+            except OSError as e:
+                logger.warning("Failed to scan source directory. path=%s error=%s", dir_path, e)
                 continue
-            sources[rel_path] = "file"
-            self._file_sources[rel_path] = file_path
 
+            listings[rel_prefix] = listing
+            for name in listing.dirs:
+                pending_dirs.append((os.path.join(dir_path, name), f"{rel_prefix}{name}/"))
+            for name in listing.files:
+                rel_path = f"{rel_prefix}{name}"
+                sources[rel_path] = "file"
+                self._file_sources[rel_path] = os.path.join(dir_path, name)
+
+        self._save_manifest(previous=previous, listings=listings, scanned_at_ns=scanned_at_ns)
         logger.debug(
-            "FileFolderProvider discover: completed. scanned=%s discovered=%s sources_dir=%s",
+            "FileFolderProvider discover: completed. scanned=%s reused_dirs=%s discovered=%s sources_dir=%s",
             scanned,
+            reused_dirs,
             len(sources),
             self._sources_dir,
         )
         return sources
 
+    def _load_manifest(self) -> SourcesManifest | None:
+        if self._manifest is None and self._manifest_path is not None:
+            self._manifest = read_manifest_file(self._manifest_path)
+        if self._manifest is None or self._manifest.sources_dir != str(self._sources_dir):
+            return None
+        return self._manifest
+
+    def _save_manifest(
+        self,
+        *,
+        previous: SourcesManifest | None,
+        listings: Dict[str, DirListing],
+        scanned_at_ns: int,
+    ) -> None:
+        self._manifest = SourcesManifest(
+            schema_version=ManifestSchemaVersion,
+            sources_dir=str(self._sources_dir),
+            scanned_at_ns=scanned_at_ns,
+            dirs=listings,
+        )
+        if self._manifest_path is None:
+            return
+        if previous is not None and previous.dirs == listings:
+            return
+        try:
+            atomic_write_json(self._manifest_path, encode_manifest(self._manifest))
+        except OSError as e:
+            logger.warning("Failed to write sources manifest. path=%s error=%s", self._manifest_path, e)
+
     async def init_record(self, *, source_id: str, now: datetime) -> CacheRecord | None:
         file_path = self._file_sources.get(source_id)
         if not file_path:
@@ -57,13 +135,13 @@ class FileFolderProvider:
 
         logger.debug("FileFolderProvider init_record: start. source_id=%s path=%s", source_id, file_path)
         try:
-            stat = file_path.stat()
+            stat = await asyncio.to_thread(os.stat, file_path)
         except OSError as e:
             logger.warning("Failed to stat file source. path=%s error=%s", file_path, e)
             return None
 
         try:
-            text = file_path.read_text(encoding="utf-8")
+            content_hash = await asyncio.to_thread(hash_file, file_path)
         except UnicodeDecodeError:
             logger.warning("Skipping non-UTF8 file source. path=%s", file_path)
             return None
@@ -71,12 +149,10 @@ class FileFolderProvider:
             logger.warning("Failed to read file source. path=%s error=%s", file_path, e)
             return None
 
-        content_hash = hash_text(text)
         logger.debug(
-            "FileFolderProvider init_record: completed. source_id=%s size_bytes=%s text_chars=%s",
+            "FileFolderProvider init_record: completed. source_id=%s size_bytes=%s",
             source_id,
             stat.st_size,
-            len(text),
         )
         return CacheRecord(
             source_type="file",
@@ -88,60 +164,90 @@ class FileFolderProvider:
         )
 
     async def refresh(self, *, cache: CacheState, now: datetime) -> bool:
-        changed = False
         logger.debug("FileFolderProvider refresh: start. known_files=%s", len(self._file_sources))
+        semaphore = asyncio.Semaphore(_REFRESH_CONCURRENCY)
+
+        async def refresh_one(rel_path: str, file_path: str, record: CacheRecord) -> bool:
+            async with semaphore:
+                probe = await asyncio.to_thread(_probe_changed_file, rel_path, file_path, record.file)
+            if probe is None:
+                return False
+            stat, content_hash = probe
+            record.file = FileMetadata(rel_path=rel_path, size_bytes=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            if content_hash != record.content_hash or record.summary_pending:
+                record.content_hash = content_hash
+                record.summary_pending = True
+            return True
+
+        tasks = []
         for rel_path, file_path in self._file_sources.items():
             record = cache.sources.get(rel_path)
             if record is None:
                 continue
             if record.source_type != "file":
                 continue
+            tasks.append(refresh_one(rel_path, file_path, record))
 
-            try:
-                stat = file_path.stat()
-            except OSError as e:
-                logger.warning("Failed to stat file source. path=%s error=%s", file_path, e)
-                continue
-
-            file_meta = record.file
-            if not file_meta:
-                file_meta = FileMetadata(rel_path=rel_path, size_bytes=stat.st_size, mtime_ns=stat.st_mtime_ns)
-
-            if file_meta.size_bytes == stat.st_size and file_meta.mtime_ns == stat.st_mtime_ns:
-                continue
-
-            logger.debug(
-                "FileFolderProvider refresh: changed file detected. rel_path=%s old_size=%s new_size=%s",
-                rel_path,
-                file_meta.size_bytes,
-                stat.st_size,
-            )
-            try:
-                text = file_path.read_text(encoding="utf-8")
-            except UnicodeDecodeError:
-                logger.warning("Skipping non-UTF8 file source. path=%s", file_path)
-                continue
-            except OSError as e:
-                logger.warning("Failed to read file source. path=%s error=%s", file_path, e)
-                continue
-
-            content_hash = hash_text(text)
-            record.file = FileMetadata(rel_path=rel_path, size_bytes=stat.st_size, mtime_ns=stat.st_mtime_ns)
-            if content_hash != record.content_hash or record.summary_pending:
-                record.content_hash = content_hash
-                record.summary_pending = True
-            changed = True
-
-        logger.debug("FileFolderProvider refresh: completed. changed=%s", changed)
-        return changed
+        results = await asyncio.gather(*tasks)
+        changed_count = sum(results)
+        logger.debug(
+            "FileFolderProvider refresh: completed. checked=%s changed_files=%s",
+            len(results),
+            changed_count,
+        )
+        return changed_count > 0
 
     async def load_text(self, *, source_id: str) -> str | None:
         file_path = self._file_sources.get(source_id)
         if not file_path:
             return None
         try:
-            return file_path.read_text(encoding="utf-8")
+            return Path(file_path).read_text(encoding="utf-8")
         except (OSError, UnicodeDecodeError):
             logger.exception("Failed to load file source text. source_id=%s path=%s", source_id, file_path)
             return None
 
+
+def _probe_changed_file(
+    rel_path: str,
+    file_path: str,
+    file_meta: FileMetadata | None,
+) -> tuple[os.stat_result, str] | None:
+    """Return the new stat and content hash when file metadata changed, otherwise None."""
+    try:
+        stat = os.stat(file_path)
+    except OSError as e:
+        logger.warning("Failed to stat file source. path=%s error=%s", file_path, e)
+        return None
+
+    if file_meta is None:
+        return None
+    if file_meta.size_bytes == stat.st_size and file_meta.mtime_ns == stat.st_mtime_ns:
+        return None
+
+    logger.debug(
+        "FileFolderProvider refresh: changed file detected. rel_path=%s old_size=%s new_size=%s",
+        rel_path,
+        file_meta.size_bytes,
+        stat.st_size,
+    )
+    try:
+        content_hash = hash_file(file_path)
+    except UnicodeDecodeError:
+        logger.warning("Skipping non-UTF8 file source. path=%s", file_path)
+        return None
+    except OSError as e:
+        logger.warning("Failed to read file source. path=%s error=%s", file_path, e)
+        return None
+    return stat, content_hash
+
+
+def _reusable_listing(manifest: SourcesManifest | None, rel_prefix: str, mtime_ns: int) -> DirListing | None:
+    if manifest is None:
+        return None
+    listing = manifest.dirs.get(rel_prefix)
+    if listing is None or listing.mtime_ns != mtime_ns:
+        return None
+    if mtime_ns >= manifest.scanned_at_ns - _MANIFEST_MTIME_SAFETY_NS:
+        return None
+    return listing
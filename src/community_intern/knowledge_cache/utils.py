@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import hashlib
+import os
 from datetime import datetime, timezone
 
+import xxhash
+
 
 def utc_now() -> datetime:
     return datetime.now(timezone.utc)
@@ -33,3 +36,32 @@ def hash_text(text: str) -> str:
     normalized = normalize_text(text)
     return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
+
+def hash_text_fast(text: str) -> str:
+    normalized = normalize_text(text)
+    return xxhash.xxh3_64_hexdigest(normalized.encode("utf-8"))
+
+
+def hash_file(path: str | os.PathLike[str]) -> str:
+    """
+    Compute the same digest as hash_text_fast for a UTF-8 file, reading it line by line.
+
+    Universal newline decoding matches the line ending conversion of normalize_text, and blank lines
+    are buffered so leading and trailing blank lines are dropped without holding the whole file.
+    """
+    digest = xxhash.xxh3_64()
+    started = False
+    pending_blank_lines = 0
+    with open(path, encoding="utf-8") as f:
+        for raw_line in f:
+            line = raw_line.rstrip()
+            if not line:
+                if started:
+                    pending_blank_lines += 1
+                continue
+            if started:
+                digest.update(b"\n" * (pending_blank_lines + 1))
+            digest.update(line.encode("utf-8"))
+            started = True
+            pending_blank_lines = 0
+    return digest.hexdigest()
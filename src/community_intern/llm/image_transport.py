@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import logging
+from collections import OrderedDict
 from typing import Optional, Sequence
 
 import aiohttp
@@ -10,6 +10,14 @@ import aiohttp
 from community_intern.core.models import ImageInput
 from community_intern.llm.image_adapters import Base64Image
 
+try:
+    from pybase64 import b64encode_as_string as _b64encode_as_string
+except ModuleNotFoundError:  # pragma: no cover
+    from base64 import b64encode as _b64encode
+
+    def _b64encode_as_string(payload: bytes) -> str:
+        return _b64encode(payload).decode("ascii")
+
 logger = logging.getLogger(__name__)
 
 _RETRYABLE_HTTP_ERRORS: tuple[type[BaseException], ...] = (
@@ -21,10 +29,46 @@ _RETRYABLE_HTTP_ERRORS: tuple[type[BaseException], ...] = (
 )
 
 
+_IMAGE_CACHE_MAX_CHARS = 64 * 1024 * 1024
+
+# Payloads at least this large are encoded off the event loop.
+_ENCODE_OFFLOAD_MIN_BYTES = 256 * 1024
+
+
 class ImageDownloadError(RuntimeError):
     pass
 
 
+class _EncodedImageCache:
+    """LRU cache of downloaded base64 payloads keyed by image URL, bounded by total encoded size."""
+
+    def __init__(self, *, max_chars: int) -> None:
+        self._max_chars = max_chars
+        self._total_chars = 0
+        self._entries: OrderedDict[str, tuple[str, str]] = OrderedDict()
+
+    def get(self, url: str) -> tuple[str, str] | None:
+        entry = self._entries.get(url)
+        if entry is not None:
+            self._entries.move_to_end(url)
+        return entry
+
+    def put(self, url: str, *, base64_data: str, mime_type: str) -> None:
+        if len(base64_data) > self._max_chars:
+            return
+        previous = self._entries.pop(url, None)
+        if previous is not None:
+            self._total_chars -= len(previous[0])
+        self._entries[url] = (base64_data, mime_type)
+        self._total_chars += len(base64_data)
+        while self._total_chars > self._max_chars:
+            _, (evicted_data, _) = self._entries.popitem(last=False)
+            self._total_chars -= len(evicted_data)
+
+
+_image_cache = _EncodedImageCache(max_chars=_IMAGE_CACHE_MAX_CHARS)
+
+
 def _resolve_mime_type(*, response_type: Optional[str], fallback: Optional[str]) -> str:
     if response_type:
         return response_type.split(";")[0].strip()
@@ -33,6 +77,12 @@ def _resolve_mime_type(*, response_type: Optional[str], fallback: Optional[str])
     return "image/jpeg"
 
 
+async def _encode_base64(payload: bytes) -> str:
+    if len(payload) >= _ENCODE_OFFLOAD_MIN_BYTES:
+        return await asyncio.to_thread(_b64encode_as_string, payload)
+    return _b64encode_as_string(payload)
+
+
 async def _download_one(
     session: aiohttp.ClientSession,
     image: ImageInput,
@@ -53,7 +103,7 @@ async def _download_one(
                 if not payload:
                     raise ImageDownloadError(f"Image download returned empty content. url={image.url}")
                 mime_type = _resolve_mime_type(response_type=content_type, fallback=image.mime_type)
-                encoded = base64.b64encode(payload).decode("ascii")
+                encoded = await _encode_base64(payload)
                 return Base64Image(
                     base64_data=encoded,
                     mime_type=mime_type,
@@ -91,22 +141,39 @@ async def download_images_as_base64(
     timeout_seconds: float,
     max_retries: int,
 ) -> list[Base64Image]:
+    """Download images as base64 payloads, reusing payloads already downloaded for the same URL."""
     if not images:
         return []
-    timeout = aiohttp.ClientTimeout(total=timeout_seconds)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        results: list[Base64Image] = []
-        for image in images:
-            try:
-                results.append(
-                    await _download_one(
+    results: list[Base64Image | None] = [_cached_image(image) for image in images]
+    missing = [idx for idx, result in enumerate(results) if result is None]
+    if missing:
+        timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            for idx in missing:
+                image = images[idx]
+                try:
+                    downloaded = await _download_one(
                         session,
                         image,
                         timeout_seconds=timeout_seconds,
                         max_retries=max_retries,
                     )
-                )
-            except Exception:
-                logger.exception("Image download failed. url=%s", image.url)
-                raise
-        return results
+                except Exception:
+                    logger.exception("Image download failed. url=%s", image.url)
+                    raise
+                _image_cache.put(image.url, base64_data=downloaded.base64_data, mime_type=downloaded.mime_type)
+                results[idx] = downloaded
+    return [result for result in results if result is not None]
+
+
+def _cached_image(image: ImageInput) -> Base64Image | None:
+    cached = _image_cache.get(image.url)
+    if cached is None:
+        return None
+    base64_data, mime_type = cached
+    return Base64Image(
+        base64_data=base64_data,
+        mime_type=mime_type,
+        source_url=image.url,
+        filename=image.filename,
+    )
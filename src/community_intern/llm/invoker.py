@@ -3,9 +3,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from typing import Optional, Sequence, Type, TypeVar
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence, Type, TypeVar
 
 from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
 from langchain_crynux import ChatCrynux
 from pydantic import BaseModel
 
@@ -13,7 +15,7 @@ from community_intern.llm.image_adapters import ImagePart, TextPart, get_image_a
 from community_intern.core.models import ImageInput
 from community_intern.llm.image_utils import build_base64_images
 from community_intern.llm.settings import LLMSettings
-from community_intern.llm.structured_output import parse_structured_llm_result
+from community_intern.llm.structured_output import extract_cached_input_tokens, parse_structured_llm_result
 from community_intern.logging.flow import format_llm_flow_log, format_text_preview, text_chars
 
 T = TypeVar("T", bound=BaseModel)
@@ -21,6 +23,12 @@ T = TypeVar("T", bound=BaseModel)
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _InflightCall:
+    task: asyncio.Task
+    waiters: int = 0
+
+
 class LLMInvoker:
     def __init__(
         self,
@@ -44,6 +52,8 @@ class LLMInvoker:
             request_timeout=llm.timeout_seconds,
             max_retries=llm.max_retries,
         )
+        self._inflight: dict[tuple[Any, ...], _InflightCall] = {}
+        self._structured_llms: dict[type[BaseModel], Runnable] = {}
 
     @property
     def project_introduction(self) -> str:
@@ -56,6 +66,59 @@ class LLMInvoker:
         user_content: str,
         images: Optional[Sequence[ImageInput]] = None,
         response_model: Type[T],
+    ) -> T:
+        """
+        Invoke the LLM with structured output.
+
+        Concurrent calls with identical inputs share a single in-flight request.
+        The shared request is cancelled once every caller waiting on it has been cancelled.
+        """
+        key = (
+            response_model,
+            system_prompt,
+            user_content,
+            tuple(image.url for image in images) if images else (),
+        )
+        call = self._inflight.get(key)
+        if call is None:
+            task = asyncio.create_task(
+                self._invoke_llm_once(
+                    system_prompt=system_prompt,
+                    user_content=user_content,
+                    images=images,
+                    response_model=response_model,
+                )
+            )
+            call = _InflightCall(task=task)
+            self._inflight[key] = call
+            task.add_done_callback(lambda _: self._discard_inflight(key, call))
+        else:
+            logger.debug(
+                "Joining in-flight LLM request with identical input. response_model=%s",
+                response_model.__name__,
+            )
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            # The task is still pending only when this waiter was cancelled.
+            if call.waiters == 0 and not call.task.done():
+                self._discard_inflight(key, call)
+                call.task.cancel()
+
+    def _discard_inflight(self, key: tuple[Any, ...], call: _InflightCall) -> None:
+        if self._inflight.get(key) is call:
+            del self._inflight[key]
+
+    async def _invoke_llm_once(
+        self,
+        *,
+        system_prompt: str,
+        user_content: str,
+        images: Optional[Sequence[ImageInput]],
+        response_model: Type[T],
     ) -> T:
         image_count = len(images) if images else 0
         if images:
@@ -78,11 +141,7 @@ class LLMInvoker:
             user_message,
         ]
 
-        structured_llm = self._llm.with_structured_output(
-            response_model,
-            method=self._llm_config.structured_output_method,
-            include_raw=True,
-        )
+        structured_llm = self._structured_llm(response_model)
         started = time.perf_counter()
         logger.info(
             "%s",
@@ -114,6 +173,7 @@ class LLMInvoker:
                     ("Response model", response_model.__name__),
                     ("Model", self._llm_config.model),
                     ("ID", response_id),
+                    ("Cached input tokens", extract_cached_input_tokens(result)),
                     ("Result type", type(validated).__name__),
                     (
                         "Elapsed milliseconds",
@@ -123,3 +183,14 @@ class LLMInvoker:
             ),
         )
         return validated
+
+    def _structured_llm(self, response_model: Type[BaseModel]) -> Runnable:
+        structured_llm = self._structured_llms.get(response_model)
+        if structured_llm is None:
+            structured_llm = self._llm.with_structured_output(
+                response_model,
+                method=self._llm_config.structured_output_method,
+                include_raw=True,
+            )
+            self._structured_llms[response_model] = structured_llm
+        return structured_llm
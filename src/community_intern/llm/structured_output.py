@@ -34,6 +34,20 @@ def extract_response_id(raw_response: Any) -> str | None:
     return response_id or None
 
 
+def extract_cached_input_tokens(result: Any) -> int | None:
+    raw_response = result.get("raw") if isinstance(result, dict) else result
+    usage_metadata = getattr(raw_response, "usage_metadata", None)
+    if not isinstance(usage_metadata, dict):
+        return None
+
+    input_token_details = usage_metadata.get("input_token_details")
+    if not isinstance(input_token_details, dict):
+        return None
+
+    cache_read = input_token_details.get("cache_read")
+    return cache_read if isinstance(cache_read, int) else None
+
+
 def _validate_structured_output(value: Any, response_model: Type[T]) -> T:
     if value is None:
         raise RuntimeError("LLM returned null structured output.")
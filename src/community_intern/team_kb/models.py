@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Literal, Sequence
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 @dataclass(slots=True)
@@ -39,4 +39,6 @@ class IntegrationResult:
 
 
 class TeamKBState(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     last_processed_qa_id: str = Field(default="")
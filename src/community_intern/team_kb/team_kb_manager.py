@@ -68,7 +68,12 @@ class TeamKnowledgeManager:
             summarization_prompt=config.team_summarization_prompt,
             summarization_concurrency=config.summarization_concurrency,
             llm_invoker=llm_invoker,
-            providers=[FileFolderProvider(sources_dir=config.team_topics_dir)],
+            providers=[
+                FileFolderProvider(
+                    sources_dir=config.team_topics_dir,
+                    manifest_path=config.team_topics_manifest_path,
+                )
+            ],
             source_type_order=["file"],
         )
 
@@ -308,7 +313,7 @@ class TeamKnowledgeManager:
                     state.last_processed_qa_id,
                     config_cursor_id,
                 )
-                state.last_processed_qa_id = config_cursor_id
+                state = state.model_copy(update={"last_processed_qa_id": config_cursor_id})
 
         return state
 
@@ -330,7 +335,7 @@ class TeamKnowledgeManager:
                     try:
                         await self._classify_and_integrate(qa_pair)
                         # Update state after success
-                        state.last_processed_qa_id = qa_pair.id
+                        state = state.model_copy(update={"last_processed_qa_id": qa_pair.id})
                         self._save_state(state)
                     except Exception:
                         logger.exception(
@@ -0,0 +1,170 @@
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+from community_intern.ai_response import impl as impl_module
+from community_intern.ai_response.cache import ResponseCache, build_response_cache_key
+from community_intern.ai_response.config import AIConfig
+from community_intern.core.models import AIResult, Conversation, ImageInput, Message, RequestContext
+
+
+def _conversation(*texts: str, images=None) -> Conversation:
+    return Conversation(
+        messages=[
+            Message(
+                role="user",
+                text=text,
+                timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+                author_id="1",
+                images=images,
+            )
+            for text in texts
+        ]
+    )
+
+
+def _context(channel_id: str = "c1") -> RequestContext:
+    return RequestContext(platform="discord", channel_id=channel_id, message_id="m1", thread_id=None, guild_id="g1")
+
+
+class ResponseCacheKeyTests(unittest.TestCase):
+    def test_key_ignores_case_and_whitespace(self) -> None:
+        a = build_response_cache_key(_conversation("How do I  start a node?"), _context(), index_text="index")
+        b = build_response_cache_key(_conversation("how do i start a node?\n"), _context(), index_text="index")
+        self.assertIsNotNone(a)
+        self.assertEqual(a, b)
+
+    def test_key_is_namespaced_by_channel(self) -> None:
+        a = build_response_cache_key(_conversation("question"), _context("c1"), index_text="index")
+        b = build_response_cache_key(_conversation("question"), _context("c2"), index_text="index")
+        self.assertNotEqual(a, b)
+
+    def test_conversation_with_images_is_not_cacheable(self) -> None:
+        image = ImageInput(url="https://example.com/a.png", mime_type="image/png", filename="a.png", size_bytes=1, source="discord")
+        self.assertIsNone(build_response_cache_key(_conversation("question", images=[image]), _context(), index_text="index"))
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def test_entries_expire_after_ttl(self) -> None:
+        cache = ResponseCache(ttl_seconds=10, max_entries=4)
+        result = AIResult(should_reply=True, reply_text="answer")
+        with mock.patch("community_intern.ai_response.cache.time.monotonic", return_value=100.0):
+            cache.set("k", result)
+            self.assertIs(cache.get("k"), result)
+        with mock.patch("community_intern.ai_response.cache.time.monotonic", return_value=111.0):
+            self.assertIsNone(cache.get("k"))
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = ResponseCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", AIResult(should_reply=True, reply_text="a"))
+        cache.set("b", AIResult(should_reply=True, reply_text="b"))
+        cache.get("a")
+        cache.set("c", AIResult(should_reply=True, reply_text="c"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+    def test_zero_ttl_disables_cache(self) -> None:
+        cache = ResponseCache(ttl_seconds=0, max_entries=2)
+        cache.set("a", AIResult(should_reply=True, reply_text="a"))
+        self.assertFalse(cache.enabled)
+        self.assertIsNone(cache.get("a"))
+
+
+class _FakeKnowledgeBase:
+    def __init__(self) -> None:
+        self.index_text = "index v1"
+        self.index_loads = 0
+
+    async def load_index_text(self) -> str:
+        self.index_loads += 1
+        return self.index_text
+
+
+class _FakeGraphApp:
+    def __init__(self) -> None:
+        self.final_state: dict = {}
+        self.calls = 0
+        self.initial_state: dict = {}
+
+    async def ainvoke(self, state, context=None):
+        self.calls += 1
+        self.initial_state = state
+        return {**state, **self.final_state}
+
+
+class GenerateReplyCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.app = _FakeGraphApp()
+        patcher = mock.patch.object(impl_module, "build_ai_graph", return_value=self.app)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        config = AIConfig.model_validate(
+            {
+                "llm": {
+                    "base_url": "http://llm",
+                    "api_key": "k",
+                    "model": "m",
+                    "timeout_seconds": 5,
+                    "max_retries": 0,
+                },
+                "graph_timeout_seconds": 5,
+                "max_sources": 3,
+                "max_answer_chars": 1000,
+                "gating_prompt": "g",
+                "selection_prompt": "s",
+                "answer_prompt": "a",
+                "verification_prompt": "v",
+            }
+        )
+        self.kb = _FakeKnowledgeBase()
+        self.service = impl_module.AIResponseService(config, kb=self.kb)
+
+    async def _reply_twice(self):
+        first = await self.service.generate_reply(_conversation("question"), _context())
+        second = await self.service.generate_reply(_conversation("question"), _context())
+        return first, second
+
+    async def test_reply_is_served_from_cache(self) -> None:
+        self.app.final_state = {"should_reply": True, "final_reply_text": "answer", "verification": True}
+        first, second = await self._reply_twice()
+        self.assertEqual(first.reply_text, "answer")
+        self.assertIs(second, first)
+        self.assertEqual(self.app.calls, 1)
+
+    async def test_index_is_loaded_once_and_passed_to_graph(self) -> None:
+        self.app.final_state = {"should_reply": False, "final_reply_text": None}
+        await self.service.generate_reply(_conversation("question"), _context())
+        self.assertEqual(self.kb.index_loads, 1)
+        self.assertTrue(self.app.initial_state["kb_index_loaded"])
+        self.assertEqual(self.app.initial_state["kb_index_text"], "index v1")
+
+    async def test_index_change_invalidates_cached_reply(self) -> None:
+        self.app.final_state = {"should_reply": True, "final_reply_text": "old answer", "verification": True}
+        await self.service.generate_reply(_conversation("question"), _context())
+        self.kb.index_text = "index v2"
+        self.app.final_state = {"should_reply": True, "final_reply_text": "new answer", "verification": True}
+        result = await self.service.generate_reply(_conversation("question"), _context())
+        self.assertEqual(result.reply_text, "new answer")
+        self.assertEqual(self.app.calls, 2)
+
+    async def test_non_reply_is_not_cached(self) -> None:
+        self.app.final_state = {"should_reply": False, "final_reply_text": None}
+        first, second = await self._reply_twice()
+        self.assertFalse(first.should_reply)
+        self.assertFalse(second.should_reply)
+        self.assertEqual(self.app.calls, 2)
+
+    async def test_verification_rejected_reply_is_not_cached(self) -> None:
+        self.app.final_state = {
+            "should_reply": False,
+            "draft_answer": "draft",
+            "final_reply_text": None,
+            "verification": False,
+        }
+        await self._reply_twice()
+        self.assertEqual(self.app.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+from community_intern.ai_response import graph as graph_module
+from community_intern.ai_response.config import AIConfig
+from community_intern.ai_response.impl import AIResponseService
+from community_intern.core.models import Conversation, Message, RequestContext
+from community_intern.kb.interfaces import SourceContent
+
+
+class _StubStructuredLLM:
+    def __init__(self, owner: "_StubChatCrynux", response_model) -> None:
+        self._owner = owner
+        self._response_model = response_model
+
+    async def ainvoke(self, messages):
+        name = self._response_model.__name__
+        self._owner.calls.append(name)
+        return {
+            "parsed": self._response_model(**self._owner.responses[name]),
+            "raw": None,
+            "parsing_error": None,
+        }
+
+
+class _StubChatCrynux:
+    instance: "_StubChatCrynux | None" = None
+
+    def __init__(self, **kwargs) -> None:
+        _ = kwargs
+        self.calls: list[str] = []
+        self.responses = {
+            "LLMGateDecision": {"should_reply": True},
+            "LLMSelectionResult": {"selected_source_ids": ["https://example.com/doc"]},
+            "LLMGenerationResult": {"answer": "Run the node with Docker."},
+            "LLMVerificationResult": {"is_good_enough": True},
+        }
+        _StubChatCrynux.instance = self
+
+    def with_structured_output(self, response_model, **kwargs):
+        _ = kwargs
+        return _StubStructuredLLM(self, response_model)
+
+
+class _FakeKnowledgeBase:
+    def __init__(self) -> None:
+        self.fail_index = False
+
+    async def load_index_text(self) -> str:
+        if self.fail_index:
+            raise OSError("index missing")
+        return "https://example.com/doc\nHow to run a node."
+
+    async def load_index_entries(self):
+        return []
+
+    async def build_index(self) -> None:
+        return None
+
+    async def load_source_content(self, *, source_id: str) -> SourceContent:
+        return SourceContent(source_id=source_id, text="Use Docker to run the node.")
+
+
+class AIGraphFlowTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        graph_module._compile_ai_graph.cache_clear()
+        self.addCleanup(graph_module._compile_ai_graph.cache_clear)
+        patcher = mock.patch.object(graph_module, "ChatCrynux", _StubChatCrynux)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        config = AIConfig.model_validate(
+            {
+                "llm": {
+                    "base_url": "http://llm",
+                    "api_key": "k",
+                    "model": "m",
+                    "timeout_seconds": 5,
+                    "max_retries": 0,
+                },
+                "graph_timeout_seconds": 5,
+                "enable_verification": True,
+                "gating_prompt": "g",
+                "selection_prompt": "s",
+                "answer_prompt": "a",
+                "verification_prompt": "v",
+                "max_sources": 3,
+                "max_answer_chars": 1000,
+                "response_cache_ttl_seconds": 0,
+            }
+        )
+        self.kb = _FakeKnowledgeBase()
+        self.service = AIResponseService(config, kb=self.kb)
+        self.llm = _StubChatCrynux.instance
+
+    async def _reply(self):
+        conversation = Conversation(
+            messages=[
+                Message(
+                    role="user",
+                    text="How do I run a node?",
+                    timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+                    author_id="1",
+                )
+            ]
+        )
+        context = RequestContext(platform="discord", channel_id="c1", message_id="m1", thread_id=None, guild_id="g1")
+        return await self.service.generate_reply(conversation, context)
+
+    async def test_happy_path_replies_with_links(self) -> None:
+        result = await self._reply()
+
+        self.assertTrue(result.should_reply)
+        self.assertEqual(result.reply_text, "Run the node with Docker.\n\nLinks:\n- https://example.com/doc")
+        self.assertEqual(
+            self.llm.calls,
+            ["LLMGateDecision", "LLMSelectionResult", "LLMGenerationResult", "LLMVerificationResult"],
+        )
+
+    async def test_gate_rejection_ends_flow(self) -> None:
+        self.llm.responses["LLMGateDecision"] = {"should_reply": False}
+
+        result = await self._reply()
+
+        self.assertFalse(result.should_reply)
+        self.assertIsNone(result.reply_text)
+        self.assertEqual(self.llm.calls, ["LLMGateDecision"])
+
+    async def test_index_load_failure_ends_flow(self) -> None:
+        self.kb.fail_index = True
+
+        with self.assertLogs(graph_module.logger, level="ERROR"):
+            result = await self._reply()
+
+        self.assertFalse(result.should_reply)
+        self.assertIsNone(result.reply_text)
+        self.assertEqual(self.llm.calls, ["LLMGateDecision"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from datetime import datetime, timezone
+
+from community_intern.core.formatters import format_conversation_as_text, format_message_as_text
+from community_intern.core.models import AttachmentInput, Conversation, Message
+
+
+def _message(role: str, text: str, attachments=None) -> Message:
+    return Message(
+        role=role,
+        text=text,
+        timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        author_id="1",
+        attachments=attachments,
+    )
+
+
+class FormatConversationTests(unittest.TestCase):
+    def test_message_lines_are_joined_with_newlines(self) -> None:
+        attachment = AttachmentInput(
+            url="https://example.com/log.txt",
+            mime_type="text/plain",
+            filename="log.txt",
+            size_bytes=10,
+            source="discord",
+            is_image=False,
+        )
+        conversation = Conversation(
+            messages=[
+                _message("user", "first line\nsecond line", attachments=[attachment]),
+                _message("assistant", "reply"),
+            ]
+        )
+
+        text = format_conversation_as_text(conversation)
+
+        self.assertEqual(text, "User: first line\nsecond line\nAttachment: log.txt\nYou: reply")
+        self.assertNotIn("\\n", text)
+
+    def test_blank_message_has_no_lines(self) -> None:
+        self.assertEqual(format_message_as_text(_message("user", "  ")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+from community_intern.knowledge_cache.providers.file_folder import FileFolderProvider
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _set_dir_mtimes(root: Path, timestamp: float) -> None:
+    for dir_path, _, _ in os.walk(root):
+        os.utime(dir_path, (timestamp, timestamp))
+
+
+class FileFolderProviderDiscoverTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.sources_dir = Path(self._tmp.name) / "sources"
+        self.manifest_path = Path(self._tmp.name) / "manifest.json"
+        (self.sources_dir / "guides" / "nodes").mkdir(parents=True)
+        (self.sources_dir / ".drafts").mkdir()
+        (self.sources_dir / "intro.md").write_text("intro", encoding="utf-8")
+        (self.sources_dir / ".hidden.md").write_text("hidden", encoding="utf-8")
+        (self.sources_dir / "guides" / "nodes" / "start.md").write_text("start", encoding="utf-8")
+        (self.sources_dir / ".drafts" / "draft.md").write_text("draft", encoding="utf-8")
+        _set_dir_mtimes(self.sources_dir, time.time() - 60)
+
+    def _discover(self) -> dict:
+        provider = FileFolderProvider(sources_dir=str(self.sources_dir), manifest_path=str(self.manifest_path))
+        return asyncio.run(provider.discover(now=NOW))
+
+    def test_discovers_files_relative_to_sources_dir(self) -> None:
+        self.assertEqual(
+            self._discover(),
+            {"intro.md": "file", "guides/nodes/start.md": "file", ".drafts/draft.md": "file"},
+        )
+        self.assertTrue(self.manifest_path.exists())
+
+    def test_unchanged_directories_are_not_rescanned_after_restart(self) -> None:
+        first = self._discover()
+        with mock.patch("community_intern.knowledge_cache.providers.file_folder.os.scandir") as scandir:
+            second = self._discover()
+        scandir.assert_not_called()
+        self.assertEqual(first, second)
+
+    def test_changed_directory_is_rescanned_after_restart(self) -> None:
+        self._discover()
+        (self.sources_dir / "guides" / "nodes" / "stop.md").write_text("stop", encoding="utf-8")
+        (self.sources_dir / "intro.md").unlink()
+        discovered = self._discover()
+        self.assertIn("guides/nodes/stop.md", discovered)
+        self.assertNotIn("intro.md", discovered)
+
+
+if __name__ == "__main__":
+    unittest.main()
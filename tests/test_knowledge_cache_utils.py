@@ -0,0 +1,38 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from community_intern.knowledge_cache.utils import hash_file, hash_text_fast
+
+
+class HashFileTests(unittest.TestCase):
+    def _assert_matches_hash_text_fast(self, raw: bytes) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "source.md"
+            path.write_bytes(raw)
+            self.assertEqual(hash_file(path), hash_text_fast(path.read_text(encoding="utf-8")))
+
+    def test_matches_hash_text_fast_for_mixed_line_endings(self) -> None:
+        self._assert_matches_hash_text_fast(b"\r\n\n  \nfirst  \r\nsecond\rthird\t\n\n\nfourth\r\n  \r\n\n")
+
+    def test_matches_hash_text_fast_for_unicode_whitespace(self) -> None:
+        self._assert_matches_hash_text_fast("﻿café  \nline\u0085\n　\nend".encode("utf-8"))
+
+    def test_matches_hash_text_fast_for_long_lines(self) -> None:
+        line = "x" * 100_000
+        self._assert_matches_hash_text_fast(f"{line}\r\n\r\n{line} \r\n".encode("utf-8"))
+
+    def test_matches_hash_text_fast_for_blank_and_empty_files(self) -> None:
+        self._assert_matches_hash_text_fast(b"")
+        self._assert_matches_hash_text_fast(b" \n\r\n\t\n")
+
+    def test_rejects_non_utf8_content(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "binary.bin"
+            path.write_bytes(b"\xff\xfe\x00")
+            with self.assertRaises(UnicodeDecodeError):
+                hash_file(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
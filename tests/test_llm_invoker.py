@@ -0,0 +1,93 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from community_intern.llm import invoker as invoker_module
+from community_intern.llm.invoker import LLMInvoker
+from community_intern.llm.models import LLMTextResult
+from community_intern.llm.settings import LLMSettings
+
+
+class _FakeChatCrynux:
+    def __init__(self, **kwargs) -> None:
+        _ = kwargs
+
+
+class LLMInvokerInflightTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        patcher = mock.patch.object(invoker_module, "ChatCrynux", _FakeChatCrynux)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.invoker = LLMInvoker(
+            llm=LLMSettings(base_url="http://llm", api_key="k", model="m", timeout_seconds=5, max_retries=0),
+            llm_image_adapter="OpenAIImageAdapter",
+        )
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.calls = 0
+        self.cancelled = 0
+
+        async def fake_invoke_llm_once(*, system_prompt, user_content, images, response_model):
+            self.calls += 1
+            self.started.set()
+            try:
+                await self.release.wait()
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+            return response_model(text=user_content)
+
+        invoke_patcher = mock.patch.object(self.invoker, "_invoke_llm_once", fake_invoke_llm_once)
+        invoke_patcher.start()
+        self.addCleanup(invoke_patcher.stop)
+
+    def _invoke(self, user_content: str = "question") -> asyncio.Task:
+        return asyncio.create_task(
+            self.invoker.invoke_llm(system_prompt="s", user_content=user_content, response_model=LLMTextResult)
+        )
+
+    async def test_identical_calls_share_one_request(self) -> None:
+        first = self._invoke()
+        second = self._invoke()
+        other = self._invoke("other")
+        await self.started.wait()
+        await asyncio.sleep(0)
+        self.release.set()
+
+        results = await asyncio.gather(first, second, other)
+
+        self.assertEqual([r.text for r in results], ["question", "question", "other"])
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(self.invoker._inflight, {})
+
+    async def test_cancelling_only_caller_cancels_request(self) -> None:
+        caller = self._invoke()
+        await self.started.wait()
+
+        caller.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+
+        self.assertEqual(self.cancelled, 1)
+        self.assertEqual(self.invoker._inflight, {})
+
+    async def test_cancelling_one_of_two_callers_keeps_request(self) -> None:
+        first = self._invoke()
+        second = self._invoke()
+        await self.started.wait()
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+        self.release.set()
+        result = await second
+
+        self.assertEqual(result.text, "question")
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.cancelled, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()